@@ -0,0 +1,47 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import authentication
+from rest_framework_simplejwt.exceptions import (AuthenticationFailed,
+                                                 InvalidToken)
+from rest_framework_simplejwt.settings import api_settings
+
+from api.cache import AUTH_USER_CACHE_KEY, cache_user, get_cached_user
+
+# Поля пользователя, которых достаточно для аутентификации и проверки прав:
+AUTH_USER_FIELDS = (
+    'id', 'username', 'role', 'is_active', 'is_staff', 'is_superuser'
+)
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """
+    JWT-аутентификация, загружающая только нужные для проверки прав поля.
+
+    Если кеш общий для всех процессов, пользователь кешируется
+    и сбрасывается из кеша при изменении.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            )
+
+        user = get_cached_user(user_id, AUTH_USER_CACHE_KEY)
+        if user is None:
+            try:
+                user = self.user_model.objects.only(*AUTH_USER_FIELDS).get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(
+                    _('User not found'), code='user_not_found'
+                )
+            cache_user(user, AUTH_USER_CACHE_KEY)
+
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive'
+            )
+        return user
@@ -0,0 +1,72 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Бэкенды, кеш которых виден только текущему процессу:
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+USER_CACHE_KEY = 'user-{}'
+AUTH_USER_CACHE_KEY = 'auth-user-{}'
+
+
+def is_cache_shared():
+    """
+    Проверить, что кеш общий для всех процессов приложения.
+
+    Сброс локального кеша доходит только до одного процесса, поэтому
+    данные, требующие сброса, кешируются только в общем кеше.
+    """
+    return settings.CACHES['default']['BACKEND'] not in LOCAL_CACHE_BACKENDS
+
+
+def get_cached_user(pk, key=USER_CACHE_KEY):
+    """Получить пользователя из кеша или None, если его там нет."""
+    if not is_cache_shared():
+        return None
+    return cache.get(key.format(pk))
+
+
+def cache_user(user, key=USER_CACHE_KEY):
+    """Положить пользователя в кеш, если кеш общий."""
+    if is_cache_shared():
+        cache.set(key.format(user.pk), user, settings.USER_CACHE_TIMEOUT)
+
+
+def invalidate_user(pk):
+    """Удалить все закешированные копии пользователя."""
+    cache.delete_many(
+        [key.format(pk) for key in (USER_CACHE_KEY, AUTH_USER_CACHE_KEY)]
+    )
+
+
+LIST_VERSION_KEY = '{prefix}-version'
+LIST_CACHE_KEY = '{prefix}-list-{version}-{url}'
+
+
+def get_list_cache_key(prefix, request):
+    """Ключ кеша для страницы списка с указанным префиксом."""
+    version = cache.get_or_set(
+        LIST_VERSION_KEY.format(prefix=prefix),
+        lambda: uuid.uuid4().hex,
+        None
+    )
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return LIST_CACHE_KEY.format(prefix=prefix, version=version, url=url)
+
+
+def invalidate_lists(*prefixes):
+    """Сбросить все закешированные страницы списков с этими префиксами."""
+    if not is_cache_shared():
+        return
+    cache.set_many(
+        {
+            LIST_VERSION_KEY.format(prefix=prefix): uuid.uuid4().hex
+            for prefix in prefixes
+        },
+        None
+    )
@@ -1,14 +1,110 @@
+import logging
+import queue
+import threading
+
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
 
+logger = logging.getLogger(__name__)
 
-def send_code(user):
+# Максимальное число писем, отправляемых через одно соединение:
+EMAIL_BATCH_SIZE = 100
+
+
+def make_code_message(user):
     confirmation_code = default_token_generator.make_token(user)
-    send_mail(
+    return EmailMessage(
         'Код подтвержения',
         f'Ваш код для получения токена {confirmation_code}',
         settings.DEFAULT_FROM_EMAIL,
         (user.email,),
-        fail_silently=False,
     )
+
+
+def send_codes(users):
+    """Отправить коды подтверждения через одно соединение."""
+    messages = [make_code_message(user) for user in users]
+    with get_connection() as connection:
+        connection.send_messages(messages)
+
+
+# Очередь id пользователей, общая для всех потоков отправки, чтобы
+# перезапуск потока не терял ещё не отправленные коды:
+_queue = queue.Queue()
+
+
+class EmailSendingWorker(threading.Thread):
+    """
+    Фоновый поток, отправляющий коды подтверждения пачками.
+    """
+
+    def __init__(self):
+        super().__init__(name='email-sending-worker', daemon=True)
+        self.queue = _queue
+
+    def enqueue(self, user_id):
+        self.queue.put(user_id)
+
+    def get_batch(self):
+        batch = [self.queue.get()]
+        while len(batch) < EMAIL_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def send_batch(self, user_ids):
+        """
+        Отправить коды через одно соединение, каждое письмо отдельно.
+
+        Письмо, которое не удалось отправить, пропускается, а уже
+        отправленные письма повторно не отправляются.
+        """
+        users = get_user_model().objects.filter(pk__in=user_ids)
+        with get_connection() as connection:
+            for user in users:
+                try:
+                    connection.send_messages([make_code_message(user)])
+                except Exception:
+                    logger.exception(
+                        'Не удалось отправить код на %s', user.email
+                    )
+
+    def run(self):
+        while True:
+            batch = self.get_batch()
+            close_old_connections()
+            try:
+                self.send_batch(batch)
+            except Exception:
+                logger.exception(
+                    'Не удалось обработать пачку кодов для %s', batch
+                )
+            finally:
+                close_old_connections()
+                for _ in batch:
+                    self.queue.task_done()
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = EmailSendingWorker()
+            _worker.start()
+    return _worker
+
+
+def send_code(user):
+    if settings.SEND_CODE_IN_BACKGROUND:
+        transaction.on_commit(lambda: get_worker().enqueue(user.pk))
+    else:
+        send_codes((user,))
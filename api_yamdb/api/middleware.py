@@ -0,0 +1,41 @@
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from api.cache import cache_user, get_cached_user, is_cache_shared
+
+
+def get_user(request):
+    """
+    Получить пользователя сессии, по возможности без запроса к БД.
+    """
+    if not is_cache_shared():
+        return auth.get_user(request)
+
+    try:
+        pk = auth._get_user_session_key(request)
+    except KeyError:
+        return auth.get_user(request)
+
+    user = get_cached_user(pk)
+    if user is not None and constant_time_compare(
+        request.session.get(auth.HASH_SESSION_KEY, ''),
+        user.get_session_auth_hash()
+    ):
+        return user
+
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache_user(user)
+    return user
+
+
+class CacheBackedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    AuthenticationMiddleware, которая берёт пользователя из кеша.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
@@ -12,17 +12,11 @@ class IsAdminOrStaffPermission(permissions.BasePermission):
 
 class IsAuthorOrModerPermission(IsAuthenticatedOrReadOnly):
 
-    def has_permission(self, request, view):
-        return True
-
     def has_object_permission(self, request, view, obj):
         return (
             request.method in permissions.SAFE_METHODS
-            or obj.author == request.user
-            or (request.user.is_authenticated and (
-                request.user.is_admin
-                or request.user.is_moderator)
-                )
+            or obj.author_id == request.user.pk
+            or request.user.is_moderator
         )
 
 
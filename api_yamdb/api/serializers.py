@@ -1,20 +1,68 @@
+import copy
+
+from api.authentication import AUTH_USER_FIELDS
+from api.cache import AUTH_USER_CACHE_KEY, cache_user, invalidate_user
 from api.email_func import send_code
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.validators import RegexValidator
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from reviews.constants import EMAIL_LENGTH, USERNAME_LENGTH
 from reviews.models import Category, Comment, Genre, Review, Title
-from reviews.validators import username_validator
+from reviews.validators import username_validator, validate_username_chars
 
 User = get_user_model()
 
+# Поля пользователя, нужные для проверки кода подтверждения и выдачи токена:
+TOKEN_USER_FIELDS = AUTH_USER_FIELDS + ('email', 'password', 'last_login')
+
+
+class CachedFieldsSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer, который строит поля один раз для каждого класса.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: copy.copy(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+
+class PlainDictMixin:
+    """
+    Миксин, возвращающий представление объекта в виде обычного dict.
+    """
+
+    def to_representation(self, instance):
+        ret = {}
+        for field in self._readable_fields:
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject)
+                else attribute
+            )
+            ret[field.field_name] = (
+                None if check_for_none is None
+                else field.to_representation(attribute)
+            )
+        return ret
+
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(CachedFieldsSerializer):
     """
     Сериализатор для модели Genre.
     """
@@ -23,7 +71,7 @@ class GenreSerializer(serializers.ModelSerializer):
         fields = ('name', 'slug')
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(CachedFieldsSerializer):
     """
     Сериализатор для модели Category.
     """
@@ -32,7 +80,7 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ('name', 'slug')
 
 
-class TitleReadSerializer(serializers.ModelSerializer):
+class TitleReadSerializer(PlainDictMixin, CachedFieldsSerializer):
     """
     Сериализатор для модели Title для чтения.
     """
@@ -48,7 +96,7 @@ class TitleReadSerializer(serializers.ModelSerializer):
         )
 
 
-class TitleWriteSerializer(serializers.ModelSerializer):
+class TitleWriteSerializer(CachedFieldsSerializer):
     """
     Сериализатор для модели Title для записи.
     """
@@ -73,7 +121,7 @@ class TitleWriteSerializer(serializers.ModelSerializer):
         )
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(PlainDictMixin, CachedFieldsSerializer):
     """
     Сериализатор для модели Review.
     """
@@ -87,20 +135,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ('id', 'author', 'text', 'score', 'pub_date')
         read_only_fields = ('author', 'title', 'pub_date')
 
-    def validate(self, data):
-        request = self.context.get('request')
-        title = data.get('title') or self.instance.title
-        author = request.user if request else data.get('author')
-
-        if (self.instance is None or self.instance.title != title) and \
-           Review.objects.filter(title=title, author=author).exists():
-            raise serializers.ValidationError('Вы уже оставили отзыв'
-                                              ' на это произведение.')
-
-        return data
-
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(PlainDictMixin, CachedFieldsSerializer):
     """
             Сериализатор для модели Comment.
     """
@@ -120,10 +156,10 @@ class GetTokenSerializer(serializers.Serializer):
     Сериализатор для получения пользователем JWT-токена.
     """
 
-    username = serializers.RegexField(
-        regex=r'^[\w.@+-]+$',
+    username = serializers.CharField(
         max_length=USERNAME_LENGTH,
-        required=True
+        required=True,
+        validators=[validate_username_chars],
     )
     confirmation_code = serializers.CharField(
         max_length=USERNAME_LENGTH,
@@ -132,7 +168,9 @@ class GetTokenSerializer(serializers.Serializer):
 
     def validate(self, data):
         username = data.get('username')
-        user = get_object_or_404(User, username=username)
+        user = get_object_or_404(
+            User.objects.only(*TOKEN_USER_FIELDS), username=username
+        )
         if not default_token_generator.check_token(
             user,
             data.get('confirmation_code')
@@ -143,23 +181,22 @@ class GetTokenSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         user = validated_data['user']
-        user.is_active = True
-        user.save()
+        if not user.is_active:
+            User.objects.filter(pk=user.pk).update(is_active=True)
+            user.is_active = True
+            invalidate_user(user.pk)
+        cache_user(user, AUTH_USER_CACHE_KEY)
         return str(RefreshToken.for_user(user).access_token)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsSerializer):
     """
     Сериализатор для управления пользователями.
     """
     username = serializers.CharField(
         max_length=USERNAME_LENGTH,
         required=True,
-        validators=[
-            RegexValidator(
-                regex=r'^[\w.@+-]+$',
-            )
-        ],
+        validators=[validate_username_chars],
     )
     email = serializers.EmailField(
         max_length=EMAIL_LENGTH,
@@ -177,22 +214,45 @@ class UserSerializer(serializers.ModelSerializer):
             'bio', 'role'
         )
 
+    unique_field_errors = {
+        'username': 'Имя пользователя уже занято.',
+        'email': 'Этот email уже используется.',
+    }
+
     def validate_username(self, value):
         if value.lower() == 'me':
             raise serializers.ValidationError(
                 'Имя пользователя "me" запрещено.')
-
-        if self.instance is None and User.objects.filter(
-                username=value).exists():
-            raise serializers.ValidationError('Имя пользователя уже занято.')
-
         return value
 
-    def validate_email(self, value):
-        if self.instance is None and User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('Этот email уже используется.')
+    def get_unique_errors(self, data):
+        """
+        Определить, какие уникальные поля уже заняты другим пользователем.
+        """
+        users = User.objects.exclude(pk=getattr(self.instance, 'pk', None))
+        return {
+            field: [message]
+            for field, message in self.unique_field_errors.items()
+            if field in data and users.filter(**{field: data[field]}).exists()
+        }
 
-        return value
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                self.get_unique_errors(validated_data)
+            )
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                self.get_unique_errors(validated_data)
+            )
 
 
 class NotAdminSerializer(UserSerializer):
@@ -216,27 +276,17 @@ class SignUpSerializer(serializers.Serializer):
         max_length=EMAIL_LENGTH
     )
 
-    def validate(self, data):
-        try:
-            User.objects.get_or_create(
-                username=data.get('username'),
-                email=data.get('email')
-            )
-        except IntegrityError:
-            raise serializers.ValidationError(
-                'Такой пользователь уже существует'
-            )
-        return data
-
     def create(self, validated_data):
-        username = validated_data['username']
-        email = validated_data['email']
-
-        user, created = User.objects.get_or_create(
-            username=username,
-            email=email
+        User.objects.bulk_create(
+            [User(**validated_data)], ignore_conflicts=True
         )
-        user.save()
+        user = User.objects.filter(**validated_data).first()
+        if user is None:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Такой пользователь уже существует'
+                ]
+            })
 
         send_code(user)
         return user
@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import invalidate_lists, invalidate_user
+from reviews.models import Category, Genre, Review, Title
+
+User = get_user_model()
+
+
+@receiver((post_save, post_delete), sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Сбросить кеш пользователя при его изменении или удалении."""
+    invalidate_user(instance.pk)
+
+
+@receiver((post_save, post_delete), sender=Title)
+@receiver((post_save, post_delete), sender=Review)
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_cached_titles(sender, **kwargs):
+    """Сбросить кеш списка произведений при изменении его данных."""
+    invalidate_lists('titles')
+
+
+@receiver((post_save, post_delete), sender=Category)
+def invalidate_cached_categories(sender, **kwargs):
+    """Сбросить кеш списков категорий и произведений."""
+    invalidate_lists('categories', 'titles')
+
+
+@receiver((post_save, post_delete), sender=Genre)
+def invalidate_cached_genres(sender, **kwargs):
+    """Сбросить кеш списков жанров и произведений."""
+    invalidate_lists('genres', 'titles')
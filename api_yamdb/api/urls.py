@@ -1,5 +1,5 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import (
     CategoryViewSet,
@@ -12,7 +12,7 @@ from .views import (
     signup,
 )
 
-v_1router = DefaultRouter()
+v_1router = SimpleRouter()
 
 v_1router.register('titles', TitleViewSet, basename='titles')
 v_1router.register('categories', CategoryViewSet, basename='categories')
@@ -1,15 +1,18 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
-from rest_framework import mixins, status, viewsets, filters
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters, mixins, permissions, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.exceptions import ValidationError
 from rest_framework.filters import SearchFilter
-from rest_framework.permissions import (AllowAny, IsAuthenticated,
-                                        IsAuthenticatedOrReadOnly)
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from reviews.models import Category, Genre, Review, Title
+from reviews.models import Category, Comment, Genre, Review, Title
 
+from api.cache import get_list_cache_key, is_cache_shared
 from api.permissions import (IsAdminOrReadOnly, IsAdminOrStaffPermission,
                              IsAuthorOrModerPermission)
 from .serializers import (CategorySerializer, CommentSerializer,
@@ -24,6 +27,36 @@ from .filters import TitleFilter
 User = get_user_model()
 
 
+class FastFilterMixin:
+    """
+    Миксин, пропускающий фильтрацию, если в запросе нет параметров.
+    """
+
+    def filter_queryset(self, queryset):
+        if not self.request.query_params:
+            return queryset
+        return super().filter_queryset(queryset)
+
+
+class CachedListMixin:
+    """
+    Миксин, кеширующий ответ на запрос списка до изменения данных.
+
+    Кеширование включается только с общим для всех процессов кешем.
+    """
+    list_cache_prefix = None
+
+    def list(self, request, *args, **kwargs):
+        if not is_cache_shared():
+            return super().list(request, *args, **kwargs)
+        key = get_list_cache_key(self.list_cache_prefix, request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, settings.LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+
 class UserViewSet(viewsets.ModelViewSet):
     """
     ViewSet для управления пользователями.
@@ -44,17 +77,17 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         Эндпоинт /api/v1/users/me/ для работы с текущим пользователем.
         """
+        user = User.objects.get(pk=request.user.pk)
         if request.method == 'GET':
-            serializer = self.get_serializer(request.user)
+            serializer = self.get_serializer(user)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
-        request.data._mutable = True
-        if 'role' in request.data:
-            request.data.pop('role')
-            request.data._mutable = False
-
+        data = {
+            key: value for key, value in request.data.items()
+            if key != 'role'
+        }
         serializer = NotAdminSerializer(
-            request.user, data=request.data, partial=True,
+            user, data=data, partial=True,
             context={'request': request}
         )
         serializer.is_valid(raise_exception=True)
@@ -62,28 +95,30 @@ class UserViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(CachedListMixin, FastFilterMixin,
+                   viewsets.ModelViewSet):
     """
     ViewSet для управления произведениями (Title).
     """
     permission_classes = [IsAdminOrReadOnly,]
-    queryset = Title.objects.all()
+    list_cache_prefix = 'titles'
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre'
+    )
+    filter_backends = (DjangoFilterBackend,)
     filterset_class = TitleFilter
 
     http_method_names = ['get', 'patch', 'post', 'delete']
 
     def get_serializer_class(self):
-        if self.action in ['list', 'retrieve']:
+        if self.request.method in permissions.SAFE_METHODS:
             return TitleReadSerializer
         return TitleWriteSerializer
 
-    def get_queryset(self):
-        return Title.objects.annotate(
-            rating=Avg('reviews__score')
-        )
-
 
-class BaseCategoryGenreViewSet(mixins.CreateModelMixin,
+class BaseCategoryGenreViewSet(CachedListMixin,
+                               FastFilterMixin,
+                               mixins.CreateModelMixin,
                                mixins.DestroyModelMixin,
                                mixins.ListModelMixin,
                                viewsets.GenericViewSet):
@@ -91,7 +126,7 @@ class BaseCategoryGenreViewSet(mixins.CreateModelMixin,
     Базовый ViewSet для категорий и жанров.
     """
 
-    permission_classes = [IsAuthenticatedOrReadOnly, IsAdminOrReadOnly]
+    permission_classes = [IsAdminOrReadOnly]
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
     lookup_field = 'slug'
@@ -102,6 +137,7 @@ class CategoryViewSet(BaseCategoryGenreViewSet):
     ViewSet для управления категориями.
     """
     queryset = Category.objects.all()
+    list_cache_prefix = 'categories'
     serializer_class = CategorySerializer
 
 
@@ -110,6 +146,7 @@ class GenreViewSet(BaseCategoryGenreViewSet):
     ViewSet для управления жанрами.
     """
     queryset = Genre.objects.all()
+    list_cache_prefix = 'genres'
     serializer_class = GenreSerializer
 
 
@@ -125,24 +162,29 @@ class ReviewViewSet(viewsets.ModelViewSet):
         """
         Получить объект Title, удостоверясь, что он существует.
         """
-        title_id = self.kwargs.get('title_id')
-        return get_object_or_404(Title, pk=title_id)
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title.objects.only('id'), pk=self.kwargs.get('title_id')
+            )
+        return self._title
 
     def get_queryset(self):
-        title = self.get_title()
-        return title.reviews.all()
+        if self.action == 'list':
+            self.get_title()
+        return Review.objects.filter(
+            title_id=self.kwargs.get('title_id')
+        ).select_related('author').only(
+            'id', 'title', 'author__username', 'text', 'score', 'pub_date'
+        )
 
     def perform_create(self, serializer):
         title = self.get_title()
-
-        existing_review = Review.objects.filter(
-            title=title, author=self.request.user
-        )
-        if existing_review.exists():
+        try:
+            with transaction.atomic():
+                serializer.save(author=self.request.user, title=title)
+        except IntegrityError:
             raise ValidationError('Вы уже оставили отзыв на это произведение.')
 
-        serializer.save(author=self.request.user, title=title)
-
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -177,13 +219,23 @@ class CommentViewSet(viewsets.ModelViewSet):
         """
         Получаем объект Review, при связи с Title.
         """
-        review_id = self.kwargs.get('review_pk')
-        title_id = self.kwargs.get('title_id')
-        return get_object_or_404(Review, pk=review_id, title_id=title_id)
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review.objects.only('id'),
+                pk=self.kwargs.get('review_pk'),
+                title_id=self.kwargs.get('title_id')
+            )
+        return self._review
 
     def get_queryset(self):
-        review = self.get_review()
-        return review.comments.all()
+        if self.action == 'list':
+            self.get_review()
+        return Comment.objects.filter(
+            review_id=self.kwargs.get('review_pk'),
+            review__title_id=self.kwargs.get('title_id')
+        ).select_related('author').only(
+            'id', 'review', 'author__username', 'text', 'pub_date'
+        )
 
     def perform_create(self, serializer):
         review = self.get_review()
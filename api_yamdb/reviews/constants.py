@@ -10,6 +10,9 @@ class RoleChoices(models.TextChoices):
     MODERATOR = 'moderator', gt('Moderator')
 
 
+# Ограничитель длины роли пользователя:
+ROLE_MAX_LENGTH = max(len(role) for role in RoleChoices.values)
+
 # Ограничитель длинны почты:
 EMAIL_LENGTH = 254
 
@@ -0,0 +1,19 @@
+# Generated by Django 3.2 on 2026-10-15 11:23
+
+from django.db import migrations, models
+import reviews.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_title_rating_sum_reviews_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='score',
+            field=models.PositiveSmallIntegerField(help_text='Rating from 1 to 10', validators=[reviews.validators.validate_score], verbose_name='Score'),
+        ),
+    ]
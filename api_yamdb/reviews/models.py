@@ -1,16 +1,15 @@
-from datetime import datetime
-
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
-from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as gt
 
 from .constants import (CHAR_OUTPUT_LIMIT, EMAIL_LENGTH, MAX_FIO_LENGTH,
-                        MAX_NAME_LENGTH, MAX_SLUG_LENGTH,
+                        MAX_NAME_LENGTH, MAX_SLUG_LENGTH, ROLE_MAX_LENGTH,
                         USERNAME_LENGTH, RoleChoices)
-from .validators import username_validator, validate_year, validate_score
+from .validators import (get_current_year, username_validator,
+                         validate_score, validate_year)
 
 
 class User(AbstractUser):
@@ -31,7 +30,7 @@ class User(AbstractUser):
         blank=True, verbose_name='BIO'
     )
     role = models.CharField(
-        max_length=max(len(role) for role in RoleChoices.values),
+        max_length=ROLE_MAX_LENGTH,
         choices=RoleChoices.choices,
         default=RoleChoices.USER,
         verbose_name='Role'
@@ -41,12 +40,12 @@ class User(AbstractUser):
         ordering = ('username',)
         verbose_name = 'User'
 
-    @property
+    @cached_property
     def is_admin(self):
         """Checks if the user has administrator rights."""
         return self.role == RoleChoices.ADMIN or self.is_superuser or self.is_staff
 
-    @property
+    @cached_property
     def is_moderator(self):
         """Checks whether the user has moderator rights."""
         return self.role == RoleChoices.MODERATOR or self.is_admin
@@ -87,7 +86,9 @@ class Title(models.Model):
     name = models.CharField(
         max_length=MAX_NAME_LENGTH, verbose_name=gt('Name')
     )
-    year = models.IntegerField(verbose_name='Year', validators=[validate_year])
+    year = models.IntegerField(
+        verbose_name='Year', validators=[validate_year], db_index=True
+    )
     description = models.TextField(
         null=True, blank=True, verbose_name=gt('Description')
     )
@@ -101,17 +102,52 @@ class Title(models.Model):
     genre = models.ManyToManyField(
         Genre, related_name='titles', verbose_name=gt('Genres')
     )
+    rating_sum = models.IntegerField(
+        default=0, editable=False, verbose_name=gt('Sum of review scores')
+    )
+    reviews_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=gt('Number of reviews')
+    )
+
+    COUNTER_FIELDS = ('rating_sum', 'reviews_count')
 
     class Meta:
         verbose_name = gt('Title')
         verbose_name_plural = gt('Titles')
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name'], name='title_name_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """Never overwrite the review counters with in-memory values.
+
+        The counters are maintained with F() updates by review signals,
+        so an ordinary save of an already loaded title must leave them
+        alone.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred_fields = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.COUNTER_FIELDS
+                and field.attname not in deferred_fields
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def rating(self):
+        """Average review score, or None if there are no reviews."""
+        if not self.reviews_count:
+            return None
+        return self.rating_sum / self.reviews_count
+
     def clean(self):
-        current_year = datetime.now().year
+        current_year = get_current_year()
         if self.year > current_year:
             raise ValidationError({"year": "Year cannot be greater than"
                                    f" {current_year}."})
@@ -134,8 +170,7 @@ class Review(models.Model):
     score = models.PositiveSmallIntegerField(
         verbose_name=gt('Score'),
         help_text=gt('Rating from 1 to 10'),
-        validators=[MinValueValidator(1), MaxValueValidator(10),
-                    validate_score]
+        validators=[validate_score]
     )
     pub_date = models.DateTimeField(
         auto_now_add=True, verbose_name=gt('Publication date')
@@ -146,10 +181,25 @@ class Review(models.Model):
         verbose_name_plural = gt('Reviews')
         ordering = ['-pub_date']
         unique_together = ('title', 'author')
+        indexes = [
+            models.Index(
+                fields=['title', '-pub_date'], name='review_title_pub_date_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'Review by {self.author} on {self.title}'
 
+    def save(self, *args, **kwargs):
+        """
+        Save the review and the title rating change in one transaction.
+
+        The rating signals read the old score in pre_save and apply the
+        difference in post_save, so both must roll back with the review.
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
 
 class Comment(models.Model):
     review = models.ForeignKey(
@@ -174,6 +224,12 @@ class Comment(models.Model):
         verbose_name = gt('Comment')
         verbose_name_plural = gt('Comments')
         ordering = ['-pub_date']
+        indexes = [
+            models.Index(
+                fields=['review', '-pub_date'],
+                name='comment_review_pub_date_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author} on {self.review}"
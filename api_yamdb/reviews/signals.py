@@ -0,0 +1,44 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Review, Title
+
+
+@receiver(pre_save, sender=Review)
+def remember_old_review_score(sender, instance, **kwargs):
+    """Lock the edited review row and remember its stored score."""
+    if instance._state.adding:
+        return
+    instance._old_score = Review.objects.select_for_update().filter(
+        pk=instance.pk
+    ).values_list('score', flat=True).first()
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_review_save(sender, instance, created,
+                                 update_fields=None, **kwargs):
+    """Add a new review to the title rating or replace an edited score."""
+    old_score = instance.__dict__.pop('_old_score', None)
+    if created:
+        Title.objects.filter(pk=instance.title_id).update(
+            rating_sum=F('rating_sum') + instance.score,
+            reviews_count=F('reviews_count') + 1
+        )
+    elif (
+        old_score is not None
+        and old_score != instance.score
+        and (update_fields is None or 'score' in update_fields)
+    ):
+        Title.objects.filter(pk=instance.title_id).update(
+            rating_sum=F('rating_sum') + instance.score - old_score
+        )
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_review_delete(sender, instance, **kwargs):
+    """Remove the score of a deleted review from the title rating."""
+    Title.objects.filter(pk=instance.title_id).update(
+        rating_sum=F('rating_sum') - instance.score,
+        reviews_count=F('reviews_count') - 1
+    )
@@ -1,31 +1,55 @@
 import re
+import time
 from datetime import datetime
 
 from django.core.exceptions import ValidationError
 
+from .constants import MAX_SCORE, MIN_SCORE
+
+USERNAME_PATTERN = re.compile(r'[\w.@+-]+')
+USERNAME_CHAR_PATTERN = re.compile(r'[\w.@+-]')
+FORBIDDEN_USERNAMES = frozenset({'me'})
+
+# Как долго (в секундах) переиспользовать вычисленный текущий год:
+CURRENT_YEAR_TTL = 60 * 60
+_current_year_cache = {'year': None, 'expires_at': 0.0}
+
 
 def username_validator(value):
-    forbidden_values = ('me',)
-    if value.lower() in forbidden_values:
+    if value.lower() in FORBIDDEN_USERNAMES:
         raise ValidationError(f'Недопустимое имя пользователя: {value}')
 
-    forbidden_chars = re.sub(r'^[\w.@+-]+\Z', '', value)
-    if forbidden_chars:
+    validate_username_chars(value)
+    return value
+
+
+def validate_username_chars(value):
+    if not USERNAME_PATTERN.fullmatch(value):
+        forbidden_chars = ''.join(
+            sorted(set(USERNAME_CHAR_PATTERN.sub('', value)))
+        )
         raise ValidationError(
-            'Недопустимые символы в имени пользователя:'
-            .join(set(forbidden_chars)))
+            f'Недопустимые символы в имени пользователя: {forbidden_chars}'
+        )
 
-    return value
+
+def get_current_year():
+    now = time.monotonic()
+    if now >= _current_year_cache['expires_at']:
+        _current_year_cache['year'] = datetime.now().year
+        _current_year_cache['expires_at'] = now + CURRENT_YEAR_TTL
+    return _current_year_cache['year']
 
 
 def validate_year(value):
-    current_year = datetime.now().year
+    current_year = get_current_year()
     if value > current_year:
         raise ValidationError(f'Year cannot be greater than {current_year}.')
 
 
 def validate_score(value):
-    if not (1 <= value <= 10):
+    if not MIN_SCORE <= value <= MAX_SCORE:
         raise ValidationError(
-            f'Score must be between 1 and 10. Got {value}.'
+            f'Score must be between {MIN_SCORE} and {MAX_SCORE}. '
+            f'Got {value}.'
         )
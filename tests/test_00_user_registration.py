@@ -335,6 +335,59 @@ class Test00UserRegistration:
             raise AssertionError(assert_msg)
         assert response.status_code == HTTPStatus.BAD_REQUEST, (assert_msg)
 
+    def test_00_registration_taken_username_error_body(self, client):
+        valid_data = {
+            'email': 'taken_username_1@yamdb.fake',
+            'username': 'taken_username'
+        }
+        response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.status_code == HTTPStatus.OK
+
+        duplicate_username_data = {
+            'email': 'taken_username_2@yamdb.fake',
+            'username': 'taken_username'
+        }
+        response = client.post(self.URL_SIGNUP, data=duplicate_username_data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {
+            'non_field_errors': ['Такой пользователь уже существует']
+        }, (
+            f'Если POST-запрос, отправленный на эндпоинт `{self.URL_SIGNUP}`, '
+            'содержит `username` зарегистрированного пользователя и '
+            'несоответствующий ему `email` - ошибка должна вернуться в ключе '
+            '`non_field_errors`.'
+        )
+
+    def test_00_registration_taken_email_error_body(self, client,
+                                                    django_user_model):
+        valid_data = {
+            'email': 'taken_email@yamdb.fake',
+            'username': 'taken_email_1'
+        }
+        response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.status_code == HTTPStatus.OK
+
+        duplicate_email_data = {
+            'email': 'taken_email@yamdb.fake',
+            'username': 'taken_email_2'
+        }
+        response = client.post(self.URL_SIGNUP, data=duplicate_email_data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {
+            'non_field_errors': ['Такой пользователь уже существует']
+        }, (
+            f'Если POST-запрос, отправленный на эндпоинт `{self.URL_SIGNUP}`, '
+            'содержит `email` зарегистрированного пользователя и незанятый '
+            '`username` - ошибка должна вернуться в ключе '
+            '`non_field_errors`.'
+        )
+        assert not django_user_model.objects.filter(
+            username=duplicate_email_data['username']
+        ).exists(), (
+            'Проверьте, что при конфликте по `email` новый пользователь не '
+            'создаётся.'
+        )
+
     def test_get_new_confirmation_code_for_existing_user(self, client):
         valid_data = {
             'email': 'test_email@yamdb.fake',
@@ -2,6 +2,7 @@ from http import HTTPStatus
 
 import pytest
 
+from reviews.models import Genre
 from tests.utils import (
     check_name_and_slug_patterns, check_pagination, check_permissions,
     create_genre
@@ -136,3 +137,17 @@ class Test03GenreAPI:
                           HTTPStatus.FORBIDDEN)
         check_permissions(moderator_client, self.GENRES_URL, data,
                           'модератора', genres, HTTPStatus.FORBIDDEN)
+
+    def test_06_genres_page_size_not_changed_by_client(self, client):
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(15)
+        )
+        response = client.get(f'{self.GENRES_URL}?page_size=1000')
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data['count'] == 15
+        assert len(data['results']) == 10, (
+            'Проверьте, что клиент не может изменить размер страницы '
+            f'ответа на GET-запрос к `{self.GENRES_URL}`.'
+        )
@@ -0,0 +1,123 @@
+import pytest
+from django.db import IntegrityError
+
+from reviews.models import Review, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.fixture
+    def title(self):
+        return Title.objects.create(name='Произведение', year=2000)
+
+    @staticmethod
+    def get_counters(title):
+        title = Title.objects.get(pk=title.pk)
+        return title.rating_sum, title.reviews_count
+
+    def test_01_review_create(self, title, user, moderator):
+        Review.objects.create(title=title, author=user, text='a', score=4)
+        Review.objects.create(title=title, author=moderator, text='b', score=9)
+        assert self.get_counters(title) == (13, 2), (
+            'Проверьте, что при создании отзыва его оценка добавляется к '
+            'рейтингу произведения.'
+        )
+        assert Title.objects.get(pk=title.pk).rating == 6.5
+
+    def test_02_review_edit(self, title, user, moderator):
+        review = Review.objects.create(
+            title=title, author=user, text='a', score=4
+        )
+        Review.objects.create(title=title, author=moderator, text='b', score=9)
+        review.score = 10
+        review.save()
+        assert self.get_counters(title) == (19, 2), (
+            'Проверьте, что при изменении оценки отзыва рейтинг '
+            'произведения пересчитывается.'
+        )
+
+    def test_03_review_delete(self, title, user, moderator):
+        review = Review.objects.create(
+            title=title, author=user, text='a', score=4
+        )
+        Review.objects.create(title=title, author=moderator, text='b', score=9)
+        review.delete()
+        assert self.get_counters(title) == (9, 1), (
+            'Проверьте, что при удалении отзыва его оценка вычитается из '
+            'рейтинга произведения.'
+        )
+
+    def test_04_review_cascade_delete(self, title, user, moderator):
+        Review.objects.create(title=title, author=user, text='a', score=4)
+        Review.objects.create(title=title, author=moderator, text='b', score=9)
+        user.delete()
+        assert self.get_counters(title) == (9, 1), (
+            'Проверьте, что при каскадном удалении отзыва вместе с автором '
+            'рейтинг произведения пересчитывается.'
+        )
+        moderator.delete()
+        assert self.get_counters(title) == (0, 0)
+        assert Title.objects.get(pk=title.pk).rating is None
+
+    def test_05_title_save_keeps_counters(self, title, user, moderator):
+        review = Review.objects.create(
+            title=title, author=user, text='a', score=4
+        )
+        Review.objects.create(
+            title=title, author=moderator, text='b', score=10
+        )
+        loaded_title = Title.objects.get(pk=title.pk)
+        review.delete()
+        loaded_title.description = 'Новое описание'
+        loaded_title.save()
+        assert self.get_counters(title) == (10, 1), (
+            'Проверьте, что сохранение произведения не перезаписывает '
+            'счётчики рейтинга устаревшими значениями.'
+        )
+        assert Title.objects.get(pk=title.pk).description == 'Новое описание'
+
+    def test_06_title_patch_keeps_counters(self, admin_client, title, user,
+                                           moderator):
+        Review.objects.create(title=title, author=user, text='a', score=4)
+        Review.objects.create(title=title, author=moderator, text='b', score=8)
+        response = admin_client.patch(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title.pk),
+            data={'name': 'Новое название'}
+        )
+        assert response.status_code == 200
+        assert self.get_counters(title) == (12, 2)
+        response = admin_client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title.pk)
+        )
+        assert response.json()['rating'] == 6, (
+            'Проверьте, что после изменения произведения его рейтинг '
+            'остаётся равным средней оценке отзывов.'
+        )
+
+    def test_07_failed_review_edit_keeps_counters(self, title, user):
+        review = Review.objects.create(
+            title=title, author=user, text='a', score=4
+        )
+        review.score = 10
+        review.text = None
+        with pytest.raises(IntegrityError):
+            review.save()
+        assert self.get_counters(title) == (4, 1), (
+            'Проверьте, что рейтинг произведения не меняется, если '
+            'сохранить изменённый отзыв не удалось.'
+        )
+
+    def test_08_review_edit_without_score(self, title, user):
+        review = Review.objects.create(
+            title=title, author=user, text='a', score=4
+        )
+        review.score = 10
+        review.text = 'b'
+        review.save(update_fields=['text'])
+        assert self.get_counters(title) == (4, 1), (
+            'Проверьте, что рейтинг произведения не меняется, если оценка '
+            'отзыва не сохранялась.'
+        )
@@ -0,0 +1,96 @@
+import pytest
+from django.core.cache import cache
+
+from api.cache import (AUTH_USER_CACHE_KEY, LIST_VERSION_KEY,
+                       USER_CACHE_KEY)
+
+FILE_CACHE_BACKEND = 'django.core.cache.backends.filebased.FileBasedCache'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09Cache:
+
+    ME_URL = '/api/v1/users/me/'
+    ADMIN_URL = '/admin/'
+    GENRES_URL = '/api/v1/genres/'
+
+    @pytest.fixture
+    def shared_cache(self, settings, tmp_path):
+        settings.CACHES = {
+            'default': {
+                'BACKEND': FILE_CACHE_BACKEND,
+                'LOCATION': str(tmp_path),
+            }
+        }
+        yield
+        cache.clear()
+
+    def test_01_local_cache_user_not_cached(self, user, user_client):
+        response = user_client.get(self.ME_URL)
+        assert response.status_code == 200
+        assert cache.get(AUTH_USER_CACHE_KEY.format(user.pk)) is None, (
+            'Проверьте, что с локальным для процесса кешем пользователь '
+            'не кешируется при аутентификации.'
+        )
+
+    def test_02_shared_cache_user_cached(self, shared_cache, user,
+                                         user_client):
+        response = user_client.get(self.ME_URL)
+        assert response.status_code == 200
+        assert cache.get(AUTH_USER_CACHE_KEY.format(user.pk)) is not None, (
+            'Проверьте, что с общим кешем пользователь кешируется '
+            'при аутентификации.'
+        )
+
+        user.is_active = False
+        user.save()
+        response = user_client.get(self.ME_URL)
+        assert response.status_code == 401, (
+            'Проверьте, что изменение пользователя сбрасывает его из кеша.'
+        )
+
+    def test_03_local_cache_session_user_not_cached(self, client,
+                                                    user_superuser):
+        client.force_login(user_superuser)
+        response = client.get(self.ADMIN_URL)
+        assert response.status_code == 200
+        assert cache.get(USER_CACHE_KEY.format(user_superuser.pk)) is None, (
+            'Проверьте, что с локальным для процесса кешем пользователь '
+            'сессии не кешируется.'
+        )
+
+    def test_04_shared_cache_session_user_cached(self, shared_cache, client,
+                                                 user_superuser):
+        client.force_login(user_superuser)
+        response = client.get(self.ADMIN_URL)
+        assert response.status_code == 200
+        cached = cache.get(USER_CACHE_KEY.format(user_superuser.pk))
+        assert cached is not None, (
+            'Проверьте, что с общим кешем пользователь сессии кешируется.'
+        )
+
+    def test_05_local_cache_list_not_cached(self, client):
+        response = client.get(self.GENRES_URL)
+        assert response.status_code == 200
+        assert cache.get(LIST_VERSION_KEY.format(prefix='genres')) is None, (
+            'Проверьте, что с локальным для процесса кешем списки '
+            'не кешируются.'
+        )
+
+    def test_06_shared_cache_list_invalidated(self, shared_cache, client,
+                                              admin_client):
+        response = client.get(self.GENRES_URL)
+        assert response.status_code == 200
+        assert response.json()['count'] == 0
+        assert cache.get(LIST_VERSION_KEY.format(prefix='genres')), (
+            'Проверьте, что с общим кешем списки кешируются.'
+        )
+
+        data = {'name': 'Жанр', 'slug': 'genre'}
+        response = admin_client.post(self.GENRES_URL, data=data)
+        assert response.status_code == 201
+        response = client.get(self.GENRES_URL)
+        assert response.json()['count'] == 1, (
+            'Проверьте, что изменение данных сбрасывает закешированные '
+            'списки.'
+        )
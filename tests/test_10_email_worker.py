@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from api import email_func
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10EmailWorker:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    @pytest.fixture(autouse=True)
+    def send_in_background(self, settings):
+        settings.SEND_CODE_IN_BACKGROUND = True
+
+    def test_01_signup_sends_code_in_background(self, client):
+        valid_data = {
+            'email': 'background@yamdb.fake',
+            'username': 'background'
+        }
+        response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.status_code == 200
+        assert wait_for(lambda: len(mail.outbox) == 1), (
+            'Проверьте, что при включённой фоновой отправке код '
+            'подтверждения отправляется на почту пользователя.'
+        )
+        assert mail.outbox[0].to == [valid_data['email']]
+
+    def test_02_worker_survives_failed_batch(self, client):
+        worker = email_func.get_worker()
+        worker.enqueue('not-a-user-id')
+        assert wait_for(lambda: not email_func._queue.unfinished_tasks)
+        assert worker.is_alive(), (
+            'Проверьте, что ошибка при обработке пачки кодов не '
+            'останавливает поток отправки.'
+        )
+
+        valid_data = {
+            'email': 'after-error@yamdb.fake',
+            'username': 'after_error'
+        }
+        response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.status_code == 200
+        assert wait_for(lambda: len(mail.outbox) == 1), (
+            'Проверьте, что после ошибки поток продолжает отправлять коды.'
+        )
+
+    def test_03_failed_message_not_resent(self, monkeypatch,
+                                          django_user_model):
+        users = [
+            django_user_model.objects.create_user(
+                username=f'batch_{idx}', email=f'batch_{idx}@yamdb.fake'
+            )
+            for idx in range(3)
+        ]
+        send_messages = EmailBackend.send_messages
+
+        def fail_for_second_user(backend, messages):
+            # Как SMTP-бэкенд: письма до ошибочного уже отправлены.
+            for message in messages:
+                if users[1].email in message.to:
+                    raise ConnectionError('SMTP error')
+                send_messages(backend, [message])
+            return len(messages)
+
+        monkeypatch.setattr(
+            EmailBackend, 'send_messages', fail_for_second_user
+        )
+        email_func.EmailSendingWorker().send_batch(
+            [user.pk for user in users]
+        )
+        recipients = sorted(message.to[0] for message in mail.outbox)
+        assert recipients == [users[0].email, users[2].email], (
+            'Проверьте, что ошибка отправки одного письма из пачки не '
+            'мешает отправке остальных и не приводит к повторной отправке '
+            'уже отправленных писем.'
+        )